@@ -14,8 +14,12 @@ from tkinter import scrolledtext
 import webbrowser
 import logging
 
-from launcher.config import APP_NAME, APP_VERSION, WEBUI_URL
+from launcher.config import (
+    APP_NAME, APP_VERSION, WEBUI_URL, OLLAMA_CONTAINER, WEBUI_CONTAINER,
+)
 from launcher import prerequisites, docker_manager
+from launcher.container_logs import ContainerLogs
+from launcher.log_viewer import LogViewer
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,11 @@ class AppWindow:
         self._status = "stopped"
         self._queue = queue.Queue()
         self._root = None
+        self._container_logs = ContainerLogs(
+            (OLLAMA_CONTAINER, WEBUI_CONTAINER),
+            on_event=self._on_container_event,
+        )
+        self._log_viewer = LogViewer(self._container_logs)
 
     # ── Build the UI ─────────────────────────────────────────────────
 
@@ -71,6 +80,11 @@ class AppWindow:
         )
         self._btn_quit.pack(side="right")
 
+        self._btn_logs = tk.Button(
+            top, text="Container Logs", command=self._on_show_logs, padx=10,
+        )
+        self._btn_logs.pack(side="right", padx=(0, 4))
+
         # ── Log area ──
         self._text = scrolledtext.ScrolledText(
             self._root, wrap=tk.WORD,
@@ -157,6 +171,19 @@ class AppWindow:
     def _on_open_webui(self):
         webbrowser.open(WEBUI_URL)
 
+    def _on_show_logs(self):
+        self._log_viewer.show(self._root)
+
+    def _on_container_event(self, event):
+        """Report Ollama performance figures parsed from the container logs."""
+        if event.kind == "model_load":
+            self.log(f"Ollama loaded a model in {event.values['seconds']:.1f}s.")
+        elif event.kind == "eval" and event.values["phase"] == "generate":
+            self.log(
+                f"Ollama generated {event.values['tokens']} tokens at "
+                f"{event.values['tokens_per_second']:.1f} tokens/s."
+            )
+
     def _on_quit(self):
         self._btn_quit.config(state=tk.DISABLED, text="Stopping...")
         thread = threading.Thread(target=self._quit_flow, daemon=True)
@@ -170,6 +197,7 @@ class AppWindow:
             self.log("Containers stopped.")
         except Exception as e:
             logger.error("Error stopping containers: %s", e)
+        self._container_logs.stop()
         # Schedule exit on the main thread
         self._root.after(0, self._root.destroy)
 
@@ -211,12 +239,14 @@ class AppWindow:
             self.log("Starting containers...")
             docker_manager.start()
             self.log("Containers started.")
+            self._container_logs.start()
 
             self.set_status("starting", "Waiting for Ollama...")
             self.log("Waiting for Ollama to be ready...")
             if not docker_manager.wait_for_ollama(timeout=180):
                 self.set_status("error", "Ollama not responding")
                 self.log("\nOllama failed to start. Check Docker Desktop is running and try again.")
+                self.log("See Container Logs for details from Ollama.")
                 return
             self.log("Ollama is ready.")
 
@@ -225,6 +255,7 @@ class AppWindow:
             if not docker_manager.wait_for_webui(timeout=180):
                 self.set_status("error", "Web interface not responding")
                 self.log("\nThe web interface failed to start. Try restarting the application.")
+                self.log("See Container Logs for details from Open WebUI.")
                 return
             self.log("Web interface is ready.")
 
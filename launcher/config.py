@@ -11,6 +11,13 @@ OLLAMA_PORT = 11434
 OLLAMA_API_BASE = f"http://localhost:{OLLAMA_PORT}"
 WEBUI_URL = f"http://localhost:{OPEN_WEBUI_PORT}"
 
+# Container names (must match container_name in docker-compose.yml)
+OLLAMA_CONTAINER = "localllm-ollama"
+WEBUI_CONTAINER = "localllm-webui"
+
+# Number of container log lines kept in memory for the log viewer
+CONTAINER_LOG_CAPACITY = 5000
+
 
 def get_app_dir():
     """Return the application directory (where the .exe or script lives)."""
@@ -0,0 +1,737 @@
+"""Container log tailing — streams the Ollama and Open WebUI container logs
+into a bounded in-memory buffer that the log viewer can filter and search.
+
+Each container is tailed by one background thread holding a single streaming
+connection to the Docker Engine API (unix socket, Windows named pipe or
+DOCKER_HOST). If the Engine API cannot be reached, the thread falls back to
+`docker logs --follow` until the next reconnect. When a stream ends (e.g. the
+container restarts) it reconnects and resumes from the last timestamp it saw.
+"""
+
+import http.client
+import io
+import logging
+import os
+import re
+import socket
+import subprocess
+import sys
+import threading
+from bisect import bisect_left
+from collections import deque, namedtuple
+from datetime import datetime, timezone
+from heapq import merge
+from urllib.parse import quote, urlencode
+
+from launcher.config import CONTAINER_LOG_CAPACITY
+
+logger = logging.getLogger(__name__)
+
+# Severity levels, lowest first. Filtering by a level shows it and everything above.
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+INITIAL_TAIL = 200          # Lines of history fetched when a container is first tailed
+RECONNECT_INTERVAL = 5      # Seconds to wait before reopening an ended stream
+CONNECT_TIMEOUT = 5         # Seconds allowed for connecting to the Engine API
+EVENT_CAPACITY = 200        # Performance events kept in memory
+MAX_MESSAGE_CHARS = 2000    # Longer log lines are truncated in the buffer
+MAX_PARTIAL_BYTES = 65536   # Unterminated output is flushed as a line past this size
+
+LogLine = namedtuple("LogLine", "seq container timestamp level message")
+PerfEvent = namedtuple("PerfEvent", "kind container timestamp values")
+
+_LEVEL_ALIASES = {
+    "TRACE": "DEBUG",
+    "DEBUG": "DEBUG",
+    "INFO": "INFO",
+    "WARN": "WARNING",
+    "WARNING": "WARNING",
+    "ERROR": "ERROR",
+    "CRITICAL": "ERROR",
+    "FATAL": "ERROR",
+    "PANIC": "ERROR",
+}
+# Ollama (Go slog): `time=... level=INFO source=... msg="..."`
+_SLOG_LEVEL_RE = re.compile(r"\blevel=([A-Za-z]+)")
+# Open WebUI / uvicorn: `INFO:     ...` or `2024-... | WARNING  | module - ...`
+_WORD_LEVEL_RE = re.compile(r"\b(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|CRITICAL|FATAL|PANIC)\b")
+_LEVEL_PREFIX_CHARS = 64
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]{2,}")
+# Numbers, durations, IP octets and timestamp fragments ("1234ms", "123z") are
+# nearly all unique, so indexing them would cost far more than it saves
+_NOISE_TOKEN_RE = re.compile(r"[\d_]+[a-z]{0,2}")
+_MAX_TOKEN_CHARS = 32
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_TIMESTAMP_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
+# `msg="llama runner started in 3.52 seconds"`
+_MODEL_LOAD_RE = re.compile(r"llama runner started in ([\d.]+) seconds")
+# llama.cpp timings, e.g.
+# `eval time = 2345.67 ms / 99 runs ( 23.69 ms per token, 42.21 tokens per second)`
+_EVAL_RE = re.compile(
+    r"\b(prompt eval|eval) time\s*=\s*([\d.]+) ms\s*/\s*(\d+) (?:tokens|runs)"
+    r"\s*\(\s*([\d.]+) ms per token,\s*([\d.]+) tokens per second\)"
+)
+# `[GIN] 2024/10/01 - 12:00:00 | 200 |  5.1234s | 172.18.0.3 | POST "/api/chat"`
+_GIN_RE = re.compile(
+    r"\[GIN\][^|]*\|\s*(\d{3})\s*\|\s*(\S+)\s*\|\s*\S+\s*\|\s*([A-Z]+)\s+\"([^\"]*)\""
+)
+_GO_DURATION_RE = re.compile(r"([\d.]+)(ns|us|µs|μs|ms|s|m|h)")
+_GO_DURATION_UNITS = {
+    "ns": 1e-9, "us": 1e-6, "µs": 1e-6, "μs": 1e-6,
+    "ms": 1e-3, "s": 1.0, "m": 60.0, "h": 3600.0,
+}
+
+
+# ── Parsing ──────────────────────────────────────────────────────────
+
+def parse_level(message):
+    """Return the severity of a log line as one of LEVELS (INFO if unknown)."""
+    match = _SLOG_LEVEL_RE.search(message)
+    if match is None:
+        match = _WORD_LEVEL_RE.search(message, 0, _LEVEL_PREFIX_CHARS)
+    if match is None:
+        return "INFO"
+    return _LEVEL_ALIASES.get(match.group(1).upper(), "INFO")
+
+
+def _parse_go_duration(text):
+    """Convert a Go duration string (e.g. "1m2.5s", "350ms") to seconds."""
+    parts = _GO_DURATION_RE.findall(text)
+    if not parts:
+        return None
+    return sum(float(value) * _GO_DURATION_UNITS[unit] for value, unit in parts)
+
+
+def parse_perf_event(container, timestamp, message):
+    """Extract a performance event from a log line, or return None.
+
+    Recognised lines (all from Ollama):
+        model_load: runner start-up time    -> {"seconds"}
+        eval:       llama.cpp timing report -> {"phase", "duration_ms", "tokens",
+                                                "ms_per_token", "tokens_per_second"}
+        request:    API request log         -> {"status", "seconds", "method", "path"}
+    """
+    match = _MODEL_LOAD_RE.search(message)
+    if match:
+        return PerfEvent("model_load", container, timestamp, {
+            "seconds": float(match.group(1)),
+        })
+
+    match = _EVAL_RE.search(message)
+    if match:
+        return PerfEvent("eval", container, timestamp, {
+            "phase": "prompt" if match.group(1) == "prompt eval" else "generate",
+            "duration_ms": float(match.group(2)),
+            "tokens": int(match.group(3)),
+            "ms_per_token": float(match.group(4)),
+            "tokens_per_second": float(match.group(5)),
+        })
+
+    match = _GIN_RE.search(message)
+    if match:
+        seconds = _parse_go_duration(match.group(2))
+        if seconds is not None:
+            return PerfEvent("request", container, timestamp, {
+                "status": int(match.group(1)),
+                "seconds": seconds,
+                "method": match.group(3),
+                "path": match.group(4),
+            })
+
+    return None
+
+
+def _tokenize(text):
+    """Return the set of lower-cased words used for keyword indexing.
+
+    Words longer than _MAX_TOKEN_CHARS are indexed by their prefix.
+    """
+    return {
+        token[:_MAX_TOKEN_CHARS] for token in _TOKEN_RE.findall(text.lower())
+        if not _NOISE_TOKEN_RE.fullmatch(token)
+    }
+
+
+def _is_word_term(term):
+    """Return True if a lower-cased search term is matched as a word prefix."""
+    return (
+        _TOKEN_RE.fullmatch(term) is not None
+        and len(term) <= _MAX_TOKEN_CHARS
+        and not _NOISE_TOKEN_RE.fullmatch(term)
+    )
+
+
+# ── Ring buffer ──────────────────────────────────────────────────────
+
+class _Postings:
+    """Ascending sequence numbers for one index key.
+
+    Evicting the oldest entry just advances a head offset; the dead prefix is
+    dropped once it makes up half the list.
+    """
+
+    __slots__ = ("seqs", "head")
+
+    def __init__(self):
+        self.seqs = []
+        self.head = 0
+
+    def __len__(self):
+        return len(self.seqs) - self.head
+
+    def append(self, seq):
+        self.seqs.append(seq)
+
+    def popleft(self):
+        self.head += 1
+        if self.head * 2 >= len(self.seqs):
+            del self.seqs[:self.head]
+            self.head = 0
+
+    def since(self, since_seq):
+        """Return the sequence numbers >= since_seq."""
+        return self.seqs[bisect_left(self.seqs, since_seq, self.head):]
+
+
+_NO_POSTINGS = _Postings()
+
+
+def _pop_posting(index, key):
+    """Drop the oldest sequence number from index[key], removing empty lists."""
+    postings = index[key]
+    postings.popleft()
+    if not postings:
+        del index[key]
+
+
+class LogBuffer:
+    """Fixed-capacity ring buffer of log lines with level, container and word indexes.
+
+    Every line gets a monotonically increasing sequence number. Once the buffer
+    is full, each new line evicts the oldest one, along with its index entries.
+    Thread-safe: the tail threads append while the UI thread queries.
+    """
+
+    def __init__(self, capacity=CONTAINER_LOG_CAPACITY):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._next_seq = 0
+        self._lock = threading.Lock()
+        # Posting lists: key -> _Postings
+        self._by_level = {level: _Postings() for level in LEVELS}
+        self._by_container = {}
+        self._by_token = {}
+
+    def __len__(self):
+        return min(self._next_seq, self.capacity)
+
+    @property
+    def next_seq(self):
+        """Sequence number the next appended line will get."""
+        return self._next_seq
+
+    def append(self, container, timestamp, message):
+        """Add a line to the buffer and return it as a LogLine."""
+        container = sys.intern(container)
+        level = parse_level(message)
+        if len(message) > MAX_MESSAGE_CHARS:
+            message = message[:MAX_MESSAGE_CHARS] + "…"
+
+        with self._lock:
+            seq = self._next_seq
+            slot = seq % self.capacity
+            if self._slots[slot] is not None:
+                self._evict(self._slots[slot])
+            self._slots[slot] = (container, timestamp, level, message)
+            self._next_seq = seq + 1
+
+            self._by_level[level].append(seq)
+            self._by_container.setdefault(container, _Postings()).append(seq)
+            for token in _tokenize(message):
+                self._by_token.setdefault(token, _Postings()).append(seq)
+
+        return LogLine(seq, container, timestamp, level, message)
+
+    def _evict(self, entry):
+        """Remove the oldest line's index entries (always the head of each list)."""
+        container, _, level, message = entry
+        self._by_level[level].popleft()
+        _pop_posting(self._by_container, container)
+        for token in _tokenize(message):
+            _pop_posting(self._by_token, token)
+
+    def search(self, level=None, keyword="", container=None, since_seq=0):
+        """Find buffered lines matching every given filter.
+
+        Candidates come from the shortest matching posting list, so a search
+        never scans lines that cannot match. Substring terms are checked on
+        those candidates.
+
+        Args:
+            level: Minimum severity (one of LEVELS), or None for all.
+            keyword: Space-separated terms that must all appear in the line,
+                case-insensitively. A term made only of letters, digits and
+                underscores matches the start of a word ("llama" matches
+                "llama_model_loader", not "tinyllama") and is looked up in the
+                word index. Any other term (e.g. "3.2", ":", a single
+                character or a bare number) matches as a substring. Empty
+                matches everything.
+            container: Container name, or None for all.
+            since_seq: Only consider lines with a sequence number >= this.
+
+        Returns:
+            (lines, next_seq): the matching LogLines, oldest first, and the
+            sequence number the search covered up to. Passing next_seq as
+            since_seq to the next search returns only lines added since.
+        """
+        terms = keyword.lower().split()
+        levels = LEVELS[LEVELS.index(level):] if level else ()
+
+        with self._lock:
+            next_seq = self._next_seq
+            since_seq = max(since_seq, next_seq - self.capacity)
+            prefixes = [term for term in terms if _is_word_term(term)]
+            substrings = [term for term in terms if not _is_word_term(term)]
+
+            sources = [(self._prefix_postings(prefix, since_seq), prefix) for prefix in prefixes]
+            if container is not None:
+                postings = self._by_container.get(container, _NO_POSTINGS)
+                sources.append((postings.since(since_seq), None))
+
+            if sources:
+                candidates, source_prefix = min(sources, key=lambda source: len(source[0]))
+                check_prefixes = [prefix for prefix in prefixes if prefix != source_prefix]
+            elif levels:
+                candidates = merge(*(self._by_level[lvl].since(since_seq) for lvl in levels))
+                check_prefixes = []
+            else:
+                candidates = range(since_seq, next_seq)
+                check_prefixes = []
+
+            lines = []
+            for seq in candidates:
+                entry_container, timestamp, entry_level, message = self._slots[seq % self.capacity]
+                if container is not None and entry_container != container:
+                    continue
+                if levels and entry_level not in levels:
+                    continue
+                if check_prefixes:
+                    tokens = _tokenize(message)
+                    if not all(
+                        any(token.startswith(prefix) for token in tokens)
+                        for prefix in check_prefixes
+                    ):
+                        continue
+                if substrings:
+                    lowered = message.lower()
+                    if not all(term in lowered for term in substrings):
+                        continue
+                lines.append(LogLine(seq, entry_container, timestamp, entry_level, message))
+
+        return lines, next_seq
+
+    def _prefix_postings(self, prefix, since_seq):
+        """Return the sequence numbers >= since_seq of lines with a word starting with prefix."""
+        matches = [
+            postings.since(since_seq)
+            for token, postings in self._by_token.items() if token.startswith(prefix)
+        ]
+        if len(matches) == 1:
+            return matches[0]
+        return sorted(set().union(*matches))
+
+
+class LogView:
+    """Incremental filtered view of a LogBuffer.
+
+    Each poll() returns only the lines added since the previous poll that
+    match the view's filters; lines already checked are never rescanned.
+    """
+
+    def __init__(self, buffer, level=None, keyword="", container=None):
+        self._buffer = buffer
+        self.level = level
+        self.keyword = keyword
+        self.container = container
+        self._next_seq = 0
+
+    def poll(self):
+        """Return newly matching lines, oldest first."""
+        lines, self._next_seq = self._buffer.search(
+            self.level, self.keyword, self.container, self._next_seq,
+        )
+        return lines
+
+
+# ── Engine API connections ───────────────────────────────────────────
+
+class _EngineUnavailable(Exception):
+    """The Docker Engine API could not be reached; use the CLI instead."""
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    """HTTP connection to the Docker Engine over a unix socket."""
+
+    def __init__(self, path):
+        super().__init__("localhost", timeout=CONNECT_TIMEOUT)
+        self._path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._path)
+        self.sock = sock
+
+
+class _PipeSocket:
+    """Just enough of the socket interface for http.client over a Windows named pipe."""
+
+    def __init__(self, path):
+        self._pipe = open(path, "r+b", buffering=0)
+
+    def sendall(self, data):
+        view = memoryview(data)
+        while view:
+            view = view[self._pipe.write(view):]
+
+    def makefile(self, mode):
+        return io.BufferedReader(self._pipe)
+
+    def settimeout(self, timeout):
+        pass
+
+    def shutdown(self, how):
+        pass
+
+    def close(self):
+        self._pipe.close()
+
+
+class _PipeConnection(http.client.HTTPConnection):
+    """HTTP connection to the Docker Engine over a Windows named pipe."""
+
+    def __init__(self, path):
+        super().__init__("localhost", timeout=CONNECT_TIMEOUT)
+        self._path = path
+
+    def connect(self):
+        self.sock = _PipeSocket(self._path)
+
+
+def _engine_connection():
+    """Return an unconnected HTTP connection to the Docker Engine API."""
+    address = os.environ.get("DOCKER_HOST", "")
+    if not address:
+        if sys.platform == "win32":
+            address = "npipe:////./pipe/docker_engine"
+        else:
+            address = "unix:///var/run/docker.sock"
+
+    scheme, _, path = address.partition("://")
+    if scheme == "unix":
+        return _UnixConnection(path)
+    if scheme == "npipe":
+        return _PipeConnection(path.replace("/", "\\"))
+    if scheme == "tcp" and not os.environ.get("DOCKER_TLS_VERIFY"):
+        host, _, port = path.rstrip("/").partition(":")
+        try:
+            port = int(port or 2375)
+        except ValueError:
+            raise _EngineUnavailable(f"invalid DOCKER_HOST {address}") from None
+        return http.client.HTTPConnection(host, port, timeout=CONNECT_TIMEOUT)
+    raise _EngineUnavailable(f"unsupported DOCKER_HOST {address}")
+
+
+def _close_connection(conn):
+    """Close a connection, unblocking any thread reading from it."""
+    if conn.sock is not None:
+        try:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    conn.close()
+
+
+def _to_epoch(timestamp):
+    """Convert a Docker RFC 3339 timestamp to whole Unix seconds."""
+    parsed = datetime.strptime(timestamp[:19], "%Y-%m-%dT%H:%M:%S")
+    return int(parsed.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _to_local(timestamp):
+    """Convert a Docker RFC 3339 (UTC) timestamp to local time, to the second."""
+    if not timestamp:
+        return ""
+    parsed = datetime.strptime(timestamp[:19], "%Y-%m-%dT%H:%M:%S")
+    return parsed.replace(tzinfo=timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class _LineSplitter:
+    """Splits a byte stream into lines, carrying partial lines between chunks."""
+
+    def __init__(self):
+        self._partial = b""
+
+    def feed(self, data):
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        if len(self._partial) > MAX_PARTIAL_BYTES:
+            lines.append(self._partial)
+            self._partial = b""
+        return lines
+
+    def flush(self):
+        rest, self._partial = self._partial, b""
+        return [rest] if rest else []
+
+
+# ── Tailing ──────────────────────────────────────────────────────────
+
+class _ContainerTail:
+    """Background thread following one container's logs.
+
+    The recent history is fetched first with a request that does not follow,
+    then the followed stream resumes after its last timestamp. Only lines from
+    the followed stream are reported as live, so telling history from new
+    activity never relies on the host and Docker VM clocks agreeing.
+    """
+
+    def __init__(self, container, on_line):
+        self.container = container
+        self._on_line = on_line
+        self._stopped = threading.Event()
+        self._closer = None
+        self._using_cli = False
+        self._last_timestamp = ""
+        self._resume_after = ""
+        self._history_loaded = False
+        self._last_error = None
+        self._emit_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"logs-{container}", daemon=True,
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Ask the thread to stop without waiting for it.
+
+        The stream is closed on a separate daemon thread: closing a named
+        pipe while another thread is blocked reading it waits until the next
+        byte arrives, which may be never.
+        """
+        self._stopped.set()
+        closer = self._closer
+        if closer is not None:
+            threading.Thread(target=self._close_quietly, args=(closer,), daemon=True).start()
+
+    @staticmethod
+    def _close_quietly(closer):
+        try:
+            closer()
+        except OSError:
+            pass
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._resume_after = self._last_timestamp
+            try:
+                try:
+                    self._stream_engine()
+                except _EngineUnavailable as e:
+                    # Fall back for this attempt only; the Engine API is
+                    # tried again on the next reconnect
+                    if not self._using_cli:
+                        logger.info("Docker Engine API unavailable (%s), tailing %s via CLI",
+                                    e, self.container)
+                        self._using_cli = True
+                    self._stream_cli()
+            except Exception as e:
+                if not self._stopped.is_set() and str(e) != self._last_error:
+                    logger.warning("Log stream for %s interrupted: %s", self.container, e)
+                    self._last_error = str(e)
+            else:
+                if not self._history_loaded:
+                    # Start following straight after the history
+                    self._history_loaded = True
+                    continue
+            self._stopped.wait(RECONNECT_INTERVAL)
+
+    def _emit(self, raw):
+        """Split off the timestamp, drop replayed lines and pass the line on."""
+        line = _ANSI_RE.sub("", raw.decode("utf-8", errors="replace")).rstrip("\r\n")
+        timestamp, _, message = line.partition(" ")
+        with self._emit_lock:
+            if not _TIMESTAMP_RE.match(timestamp):
+                timestamp, message = "", line
+            elif self._resume_after and timestamp <= self._resume_after:
+                return
+            else:
+                self._last_timestamp = max(self._last_timestamp, timestamp)
+                self._last_error = None
+            if message.strip():
+                self._on_line(self.container, timestamp, message.rstrip(), self._history_loaded)
+
+    def _history_params(self):
+        """Return (follow, since, tail) for the next logs request.
+
+        The first request fetches a short tail of history without following;
+        later ones follow everything after the last line seen.
+        """
+        if not self._history_loaded:
+            return False, None, str(INITIAL_TAIL)
+        if self._last_timestamp:
+            return True, _to_epoch(self._last_timestamp), "all"
+        return True, None, "all"
+
+    def _stream_engine(self):
+        try:
+            conn = _engine_connection()
+            conn.connect()
+        except OSError as e:
+            raise _EngineUnavailable(e) from e
+        if self._using_cli:
+            logger.info("Docker Engine API available again, tailing %s via the API",
+                        self.container)
+            self._using_cli = False
+
+        self._closer = lambda: _close_connection(conn)
+        try:
+            if self._stopped.is_set():
+                return
+            follow, since, tail = self._history_params()
+            params = {
+                "follow": int(follow), "stdout": 1, "stderr": 1, "timestamps": 1, "tail": tail,
+            }
+            if since is not None:
+                params["since"] = since
+            conn.request("GET", f"/containers/{quote(self.container)}/logs?{urlencode(params)}")
+            response = conn.getresponse()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status} {response.reason}")
+            conn.sock.settimeout(None)
+            self._read_engine_stream(response)
+        finally:
+            self._closer = None
+            conn.close()
+
+    def _read_engine_stream(self, response):
+        """Read a logs response in either raw (TTY) or multiplexed format.
+
+        Containers without a TTY (Open WebUI) send 8-byte frame headers: the
+        stream id (0-2), three zero bytes and a big-endian payload size.
+        """
+        header = response.read(8)
+        if len(header) == 8 and header[0] <= 2 and header[1:4] == b"\0\0\0":
+            splitters = {}
+            while len(header) == 8:
+                payload = response.read(int.from_bytes(header[4:], "big"))
+                splitter = splitters.setdefault(header[0], _LineSplitter())
+                for line in splitter.feed(payload):
+                    self._emit(line)
+                header = response.read(8)
+            for splitter in splitters.values():
+                for line in splitter.flush():
+                    self._emit(line)
+            return
+
+        splitter = _LineSplitter()
+        chunk = header
+        while chunk:
+            for line in splitter.feed(chunk):
+                self._emit(line)
+            chunk = response.read1(65536)
+        for line in splitter.flush():
+            self._emit(line)
+
+    def _stream_cli(self):
+        follow, since, tail = self._history_params()
+        cmd = ["docker", "logs", "--timestamps", "--tail", tail]
+        if follow:
+            cmd.append("--follow")
+        if since is not None:
+            cmd += ["--since", str(since)]
+        cmd.append(self.container)
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._closer = process.kill
+        errors = deque(maxlen=5)
+        stderr_reader = threading.Thread(
+            target=self._read_cli_stderr, args=(process.stderr, errors), daemon=True,
+        )
+        stderr_reader.start()
+        try:
+            if self._stopped.is_set():
+                # stop() may have run before the closer was set
+                process.kill()
+                return
+            for line in iter(process.stdout.readline, b""):
+                self._emit(line)
+            process.wait()
+            stderr_reader.join()
+        finally:
+            self._closer = None
+            process.stdout.close()
+        if process.returncode != 0 and not self._stopped.is_set():
+            detail = " ".join(errors) or f"exited with code {process.returncode}"
+            raise RuntimeError(f"docker logs: {detail}")
+
+    def _read_cli_stderr(self, stream, errors):
+        """Pass the container's stderr lines on; keep docker's own messages as errors.
+
+        `docker logs` relays the container's stderr on its own stderr, where
+        those lines carry timestamps. Anything else comes from docker itself.
+        """
+        with stream:
+            for raw in iter(stream.readline, b""):
+                if _TIMESTAMP_RE.match(raw.decode("utf-8", errors="replace")):
+                    self._emit(raw)
+                elif raw.strip():
+                    errors.append(raw.decode("utf-8", errors="replace").strip())
+
+
+class ContainerLogs:
+    """Tails a set of containers into one shared LogBuffer.
+
+    Args:
+        containers: Container names to follow.
+        capacity: Maximum number of lines kept in the buffer.
+        on_event: Optional callback(PerfEvent), called from the tail threads
+            for lines from the followed log streams. Events in the history
+            fetched at start are only recorded in `events`.
+    """
+
+    def __init__(self, containers, capacity=CONTAINER_LOG_CAPACITY, on_event=None):
+        self.containers = tuple(containers)
+        self.buffer = LogBuffer(capacity)
+        self.events = deque(maxlen=EVENT_CAPACITY)
+        self._on_event = on_event
+        self._tails = []
+
+    def start(self):
+        """Start tailing every container (no-op if already started)."""
+        if self._tails:
+            return
+        logger.info("Tailing container logs: %s", ", ".join(self.containers))
+        self._tails = [_ContainerTail(name, self._handle_line) for name in self.containers]
+        for tail in self._tails:
+            tail.start()
+
+    def stop(self):
+        """Stop all tail threads without blocking. Buffered lines are kept."""
+        for tail in self._tails:
+            tail.stop()
+        self._tails = []
+
+    def _handle_line(self, container, timestamp, message, live):
+        # Local time to the second, to match the launcher's own log
+        timestamp = _to_local(timestamp)
+        self.buffer.append(container, timestamp, message)
+        event = parse_perf_event(container, timestamp, message)
+        if event is not None:
+            self.events.append(event)
+            if self._on_event and live:
+                self._on_event(event)
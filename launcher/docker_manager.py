@@ -8,6 +8,8 @@ from launcher.config import (
     get_compose_file,
     get_app_dir,
     OLLAMA_API_BASE,
+    OLLAMA_CONTAINER,
+    WEBUI_CONTAINER,
     FIRST_RUN_MARKER,
 )
 
@@ -108,8 +110,8 @@ def status():
             running[name] = state.lower() == "running"
 
     return {
-        "ollama": running.get("localllm-ollama", False),
-        "webui": running.get("localllm-webui", False),
+        "ollama": running.get(OLLAMA_CONTAINER, False),
+        "webui": running.get(WEBUI_CONTAINER, False),
     }
 
 
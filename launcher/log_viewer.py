@@ -0,0 +1,135 @@
+"""Container log viewer — a secondary window showing the Ollama and
+Open WebUI container logs collected by container_logs.ContainerLogs.
+
+The window polls the shared log buffer through a LogView, so each refresh
+only renders lines added since the last one. Changing a filter rebuilds the
+view from the buffer's indexes.
+"""
+
+import tkinter as tk
+from tkinter import scrolledtext
+
+from launcher.config import APP_NAME
+from launcher.container_logs import LEVELS, LogView
+
+REFRESH_MS = 500
+ALL = "All"
+
+LEVEL_COLORS = {
+    "DEBUG": "#808080",
+    "WARNING": "#FFAA00",
+    "ERROR": "#FF5555",
+}
+
+
+class LogViewer:
+    """Window for browsing, filtering and searching container logs."""
+
+    def __init__(self, container_logs):
+        self._logs = container_logs
+        self._window = None
+        self._view = None
+        self._after_id = None
+
+    # ── Build the UI ─────────────────────────────────────────────────
+
+    def show(self, parent):
+        """Open the window, or raise it if it is already open."""
+        if self._window is not None:
+            self._window.deiconify()
+            self._window.lift()
+            return
+
+        self._window = tk.Toplevel(parent)
+        self._window.title(f"{APP_NAME} — Container Logs")
+        self._window.geometry("820x480")
+        self._window.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # ── Filter bar ──
+        bar = tk.Frame(self._window)
+        bar.pack(fill="x", padx=10, pady=(10, 0))
+
+        tk.Label(bar, text="Container:").pack(side="left")
+        self._container_var = tk.StringVar(value=ALL)
+        tk.OptionMenu(
+            bar, self._container_var, ALL, *self._logs.containers,
+            command=lambda _: self._reset(),
+        ).pack(side="left", padx=(2, 10))
+
+        tk.Label(bar, text="Level:").pack(side="left")
+        self._level_var = tk.StringVar(value=ALL)
+        tk.OptionMenu(
+            bar, self._level_var, ALL, *LEVELS,
+            command=lambda _: self._reset(),
+        ).pack(side="left", padx=(2, 10))
+
+        tk.Button(bar, text="Search", command=self._reset, padx=10).pack(side="right")
+        self._keyword_var = tk.StringVar()
+        search = tk.Entry(bar, textvariable=self._keyword_var)
+        search.pack(side="right", fill="x", expand=True, padx=(10, 4))
+        search.bind("<Return>", lambda _: self._reset())
+
+        # ── Log area ──
+        self._text = scrolledtext.ScrolledText(
+            self._window, wrap=tk.NONE,
+            font=("Consolas", 9), state=tk.DISABLED,
+            bg="#1e1e1e", fg="#cccccc",
+            insertbackground="#cccccc", padx=8, pady=8,
+        )
+        self._text.pack(fill="both", expand=True, padx=10, pady=10)
+        for level, color in LEVEL_COLORS.items():
+            self._text.tag_config(level, foreground=color)
+
+        self._reset()
+
+    # ── Rendering ────────────────────────────────────────────────────
+
+    def _reset(self):
+        """Apply the current filters and re-render from the start of the buffer."""
+        container = self._container_var.get()
+        level = self._level_var.get()
+        self._view = LogView(
+            self._logs.buffer,
+            level=None if level == ALL else level,
+            keyword=self._keyword_var.get(),
+            container=None if container == ALL else container,
+        )
+        self._text.config(state=tk.NORMAL)
+        self._text.delete("1.0", tk.END)
+        self._text.config(state=tk.DISABLED)
+        if self._after_id is not None:
+            self._window.after_cancel(self._after_id)
+        self._refresh()
+
+    def _refresh(self):
+        """Append newly matching lines, then schedule the next refresh."""
+        lines = self._view.poll()
+        if lines:
+            follow = self._text.yview()[1] >= 1.0
+            show_container = self._view.container is None
+            self._text.config(state=tk.NORMAL)
+            for line in lines:
+                prefix = f"{line.timestamp} "
+                if show_container:
+                    prefix += f"[{line.container}] "
+                self._text.insert(tk.END, prefix + line.message + "\n", line.level)
+            self._trim()
+            if follow:
+                self._text.see(tk.END)
+            self._text.config(state=tk.DISABLED)
+        self._after_id = self._window.after(REFRESH_MS, self._refresh)
+
+    def _trim(self):
+        """Keep the text widget no larger than the log buffer."""
+        line_count = int(self._text.index("end-1c").split(".")[0]) - 1
+        excess = line_count - self._logs.buffer.capacity
+        if excess > 0:
+            self._text.delete("1.0", f"{excess + 1}.0")
+
+    def _on_close(self):
+        if self._after_id is not None:
+            self._window.after_cancel(self._after_id)
+            self._after_id = None
+        self._window.destroy()
+        self._window = None
+        self._view = None